@@ -0,0 +1,143 @@
+import math
+from typing import *
+
+from ..utils import Comparator, default_comparator
+
+T = TypeVar("T")
+
+MAX_COUNT = 255
+
+
+class BloomFilterStats(NamedTuple):
+    capacity: int
+    count: int
+    size: int
+    hash_count: int
+    false_positive_rate: float
+    estimated_false_positive_rate: float
+    lookups: int
+    negatives: int
+    false_positives: int
+    observed_false_positive_rate: float
+
+
+class CountingBloomFilter(Generic[T]):
+    """Counting Bloom filter over hash(key(value)).
+
+    key defaults to the identity, so membership follows hash and ==. Callers that
+    compare values some other way (say, case-insensitively) must pass a key that
+    maps values they consider equal to equal, hashable keys (say, str.lower);
+    otherwise the filter reports false negatives. Unhashable values, such as
+    lists, raise TypeError unless key maps them to something hashable (say,
+    tuple).
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        false_positive_rate: float = 0.01,
+        key: Optional[Callable[[T], Hashable]] = None,
+    ) -> None:
+        self.false_positive_rate = false_positive_rate
+        self.key = key
+
+        self.lookups = 0
+        self.negatives = 0
+        self.false_positives = 0
+
+        self._allocate(capacity)
+
+    def _allocate(self, capacity: int) -> None:
+        self.capacity = max(1, capacity)
+        self.size = math.ceil(
+            -self.capacity * math.log(self.false_positive_rate) / math.log(2) ** 2
+        )
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+
+        self.counters = bytearray(self.size)
+        self.count = 0
+
+    def _indices(self, value: T) -> Iterator[int]:
+        if self.key is not None:
+            value = self.key(value)
+
+        h1 = hash(value)
+        h2 = hash((value, h1)) | 1
+
+        for n in range(self.hash_count):
+            yield (h1 + n * h2) % self.size
+
+    def add(self, value: T) -> None:
+        counters = self.counters
+        for ix in self._indices(value):
+            if counters[ix] < MAX_COUNT:
+                counters[ix] += 1
+
+        self.count += 1
+
+    def remove(self, value: T) -> None:
+        counters = self.counters
+        for ix in self._indices(value):
+            # Saturated counters have lost their true count, so they stay put.
+            if 0 < counters[ix] < MAX_COUNT:
+                counters[ix] -= 1
+
+        self.count -= 1
+
+    def __contains__(self, value: T) -> bool:
+        self.lookups += 1
+
+        counters = self.counters
+        for ix in self._indices(value):
+            if counters[ix] == 0:
+                self.negatives += 1
+                return False
+
+        return True
+
+    def rebuild(self, values: Iterable[T], capacity: Optional[int] = None) -> None:
+        self._allocate(self.capacity if capacity is None else capacity)
+
+        for value in values:
+            self.add(value)
+
+    def estimated_false_positive_rate(self) -> float:
+        k = self.hash_count
+        return (1 - math.exp(-k * self.count / self.size)) ** k
+
+    def stats(self) -> BloomFilterStats:
+        return BloomFilterStats(
+            capacity=self.capacity,
+            count=self.count,
+            size=self.size,
+            hash_count=self.hash_count,
+            false_positive_rate=self.false_positive_rate,
+            estimated_false_positive_rate=self.estimated_false_positive_rate(),
+            lookups=self.lookups,
+            negatives=self.negatives,
+            false_positives=self.false_positives,
+            observed_false_positive_rate=(
+                self.false_positives / (self.false_positives + self.negatives)
+                if self.false_positives + self.negatives > 0
+                else 0.0
+            ),
+        )
+
+
+def make_filter(
+    comparator: Comparator,
+    false_positive_rate: Optional[float],
+    capacity: int,
+    key: Optional[Callable[[T], Hashable]] = None,
+) -> Optional[CountingBloomFilter[T]]:
+    """Builds a tree's filter, or returns None when false_positive_rate is None.
+
+    The filter hashes values, which only agrees with the default comparator;
+    any other comparator needs a key that maps equal values together.
+    """
+    if false_positive_rate is None:
+        return None
+    elif comparator is not default_comparator and key is None:
+        raise ValueError("a custom comparator needs a matching bloom_key")
+
+    return CountingBloomFilter(capacity, false_positive_rate, key)
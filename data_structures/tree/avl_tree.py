@@ -0,0 +1,79 @@
+from typing import *
+
+from .binary_tree import BinaryTree, Node
+
+T = TypeVar("T")
+
+
+class AVLNode(Node[T]):
+    __slots__ = ("height",)
+
+    def __init__(self, value: T, parent: Optional[Node[T]] = None) -> None:
+        super().__init__(value, parent)
+        self.height = 1
+
+
+def height(node: Optional[AVLNode[T]]) -> int:
+    return 0 if node is None else node.height
+
+
+def update_height(node: AVLNode[T]) -> None:
+    node.height = 1 + max(height(node.left), height(node.right))
+
+
+class AVLTree(BinaryTree[T]):
+    def _create_node(self, input_value: T, parent: Optional[Node[T]]) -> Node[T]:
+        return AVLNode(input_value, parent)
+
+    def _rotate_left(self, node: AVLNode[T]) -> AVLNode[T]:
+        pivot = super()._rotate_left(node)
+
+        update_height(node)
+        update_height(pivot)
+
+        return pivot
+
+    def _rotate_right(self, node: AVLNode[T]) -> AVLNode[T]:
+        pivot = super()._rotate_right(node)
+
+        update_height(node)
+        update_height(pivot)
+
+        return pivot
+
+    def _balance(self, node: AVLNode[T]) -> AVLNode[T]:
+        update_height(node)
+        balance = height(node.left) - height(node.right)
+
+        if balance > 1:
+            if height(node.left.left) < height(node.left.right):
+                self._rotate_left(node.left)
+            node = self._rotate_right(node)
+        elif balance < -1:
+            if height(node.right.right) < height(node.right.left):
+                self._rotate_right(node.right)
+            node = self._rotate_left(node)
+
+        return node
+
+    def _retrace(self, node: Optional[AVLNode[T]]) -> None:
+        while node is not None:
+            previous_height = node.height
+            node = self._balance(node)
+
+            if node.height == previous_height:
+                break
+
+            node = node.parent
+
+    def _insert_fixup(self, node: AVLNode[T]) -> None:
+        self._retrace(node.parent)
+
+    def _delete_fixup(
+        self,
+        node: AVLNode[T],
+        child: Optional[AVLNode[T]],
+        parent: Optional[AVLNode[T]],
+        is_left: bool,
+    ) -> None:
+        self._retrace(parent)
@@ -0,0 +1,222 @@
+from typing import *
+
+from ..utils import Comparator, default_comparator
+
+T = TypeVar("T")
+
+
+class Node(Generic[T]):
+    __slots__ = ("value", "left", "right", "parent")
+
+    def __init__(self, value: T, parent: Optional["Node[T]"] = None) -> None:
+        self.value = value
+        self.left: Optional["Node[T]"] = None
+        self.right: Optional["Node[T]"] = None
+        self.parent = parent
+
+    def __repr__(self) -> str:
+        return f"{self.value}"
+
+    def is_leaf(self) -> bool:
+        return self.left is None and self.right is None
+
+    def is_root(self) -> bool:
+        return self.parent is None
+
+
+class BinaryTree(Generic[T]):
+    def __init__(self, comparator: Comparator = default_comparator):
+        self.comparator = comparator
+        self.root: Optional[Node[T]] = None
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, input_value: T) -> bool:
+        return self.contains(input_value)
+
+    def __iter__(self) -> Iterator[T]:
+        node = self._first(self.root)
+        while node is not None:
+            yield node.value
+            node = self._successor(node)
+
+    def _create_node(self, input_value: T, parent: Optional[Node[T]]) -> Node[T]:
+        return Node(input_value, parent)
+
+    @staticmethod
+    def _first(node: Optional[Node[T]]) -> Optional[Node[T]]:
+        if node is not None:
+            while node.left is not None:
+                node = node.left
+        return node
+
+    @staticmethod
+    def _last(node: Optional[Node[T]]) -> Optional[Node[T]]:
+        if node is not None:
+            while node.right is not None:
+                node = node.right
+        return node
+
+    @staticmethod
+    def _successor(node: Node[T]) -> Optional[Node[T]]:
+        if node.right is not None:
+            return BinaryTree._first(node.right)
+
+        while node.parent is not None and node is node.parent.right:
+            node = node.parent
+
+        return node.parent
+
+    def _replace_child(
+        self, parent: Optional[Node[T]], node: Node[T], child: Optional[Node[T]]
+    ) -> None:
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
+        else:
+            parent.right = child
+
+    def _rotate_left(self, node: Node[T]) -> Node[T]:
+        pivot = node.right
+
+        node.right = pivot.left
+        if pivot.left is not None:
+            pivot.left.parent = node
+
+        pivot.parent = node.parent
+        self._replace_child(node.parent, node, pivot)
+
+        pivot.left = node
+        node.parent = pivot
+
+        return pivot
+
+    def _rotate_right(self, node: Node[T]) -> Node[T]:
+        pivot = node.left
+
+        node.left = pivot.right
+        if pivot.right is not None:
+            pivot.right.parent = node
+
+        pivot.parent = node.parent
+        self._replace_child(node.parent, node, pivot)
+
+        pivot.right = node
+        node.parent = pivot
+
+        return pivot
+
+    def _lower_bound(self, input_value: T) -> Optional[Node[T]]:
+        node, bound = self.root, None
+
+        while node is not None:
+            if self.comparator(node.value, input_value) < 0:
+                node = node.right
+            else:
+                node, bound = node.left, node
+
+        return bound
+
+    def find(self, input_value: T) -> Optional[Node[T]]:
+        node = self.root
+
+        while node is not None:
+            comp = self.comparator(input_value, node.value)
+
+            if comp < 0:
+                node = node.left
+            elif comp > 0:
+                node = node.right
+            else:
+                return node
+
+        return None
+
+    def contains(self, input_value: T) -> bool:
+        return self.find(input_value) is not None
+
+    def min(self) -> Optional[T]:
+        node = self._first(self.root)
+        return None if node is None else node.value
+
+    def max(self) -> Optional[T]:
+        node = self._last(self.root)
+        return None if node is None else node.value
+
+    def range(self, low: T, high: T) -> Iterator[T]:
+        node = self._lower_bound(low)
+
+        while node is not None and self.comparator(node.value, high) < 0:
+            yield node.value
+            node = self._successor(node)
+
+    def _insert_fixup(self, node: Node[T]) -> None:
+        pass
+
+    def _insert(self, input_value: T) -> Node[T]:
+        parent, node, comp = None, self.root, 0
+
+        while node is not None:
+            comp = self.comparator(input_value, node.value)
+
+            parent = node
+            node = node.left if comp < 0 else node.right
+
+        node = self._create_node(input_value, parent)
+
+        if parent is None:
+            self.root = node
+        elif comp < 0:
+            parent.left = node
+        else:
+            parent.right = node
+
+        self.size += 1
+
+        return node
+
+    def insert(self, *input_values: T) -> None:
+        for input_value in input_values:
+            self._insert_fixup(self._insert(input_value))
+
+    def _delete_fixup(
+        self,
+        node: Node[T],
+        child: Optional[Node[T]],
+        parent: Optional[Node[T]],
+        is_left: bool,
+    ) -> None:
+        pass
+
+    def delete(self, input_value: T):
+        node = self.find(input_value)
+
+        if node is None:
+            return None
+
+        value = node.value
+
+        if node.left is not None and node.right is not None:
+            successor = self._first(node.right)
+            node.value = successor.value
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        parent = node.parent
+        is_left = parent is not None and parent.left is node
+
+        if child is not None:
+            child.parent = parent
+        self._replace_child(parent, node, child)
+
+        self.size -= 1
+        self._delete_fixup(node, child, parent, is_left)
+
+        return value
+
+    def for_each(self, func: Callable[[T], None]) -> None:
+        for value in self:
+            func(value)
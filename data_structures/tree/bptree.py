@@ -1,6 +1,9 @@
 from typing import *
 
 from ..utils import Comparator, bisect_left, bisect_right, _bisect, default_comparator
+from ..set.bloom_filter import BloomFilterStats, CountingBloomFilter, make_filter
+from .cursor import TreeCursor
+from .profile import TreeProfile, profile_tree
 
 T = TypeVar("T")
 
@@ -25,6 +28,7 @@ class Node(Generic[T]):
             child.parent = self
 
         self.values = values
+        self.tombstones: Optional[List[bool]] = None
         self.parent = parent
 
         self.next = None
@@ -55,9 +59,45 @@ class Node(Generic[T]):
     def has_children(self) -> bool:
         return len(self.children) > 0
 
+    def is_tombstone(self, ix: int) -> bool:
+        return self.tombstones is not None and self.tombstones[ix]
+
+    def set_tombstone(self, ix: int, tombstone: bool) -> None:
+        if self.tombstones is None:
+            if not tombstone:
+                return
+            self.tombstones = [False] * len(self.values)
+
+        self.tombstones[ix] = tombstone
+
+    def insert_value(self, ix: int, value: T) -> None:
+        self.values.insert(ix, value)
+        if self.tombstones is not None:
+            self.tombstones.insert(ix, False)
+
+    def pop_value(self, ix: int = -1) -> Tuple[T, bool]:
+        tombstone = False if self.tombstones is None else self.tombstones.pop(ix)
+        return self.values.pop(ix), tombstone
+
+    def pop_values(self, low: int, high: int) -> Tuple[List[T], int]:
+        values = self.values[low:high]
+        del self.values[low:high]
+
+        if self.tombstones is None:
+            return values, 0
+
+        tombstones = self.tombstones[low:high]
+        del self.tombstones[low:high]
+
+        live = [value for value, tombstone in zip(values, tombstones) if not tombstone]
+
+        return live, len(values) - len(live)
+
     def split(self) -> Tuple[T, "Node[T]"]:
         split_children_ix = (self.tree_order + 1) // 2
-        split_values_ix = self.tree_order // 2
+        split_values_ix = (
+            self.tree_order // 2 if self.is_leaf() else split_children_ix - 1
+        )
 
         right_children = self.children[split_children_ix:]
         self.children = self.children[:split_children_ix]
@@ -73,6 +113,14 @@ class Node(Generic[T]):
         )
 
         if right_node.is_leaf():
+            if self.tombstones is not None:
+                right_node.tombstones = self.tombstones[split_values_ix:]
+                self.tombstones = self.tombstones[:split_values_ix]
+
+            right_node.next = self.next
+            if self.next is not None:
+                self.next.previous = right_node
+
             self.next = right_node
             right_node.previous = self
 
@@ -96,10 +144,37 @@ class Node(Generic[T]):
 
 
 class BPTree(Generic[T]):
-    def __init__(self, order: int, comparator: Comparator = default_comparator):
+    def __init__(
+        self,
+        order: int,
+        comparator: Comparator = default_comparator,
+        lazy_delete: bool = False,
+        compact_threshold: float = 0.5,
+        false_positive_rate: Optional[float] = None,
+        bloom_capacity: int = 1024,
+        bloom_key: Optional[Callable[[T], Hashable]] = None,
+    ):
         self.order = order
         self.comparator = comparator
         self.root: Node[T] = Node(tree_order=order)
+        self.head: Node[T] = self.root
+        self.tail: Node[T] = self.root
+        self.size = 0
+        self.version = 0
+
+        self.lazy_delete = lazy_delete
+        self.compact_threshold = compact_threshold
+        self.tombstone_count = 0
+
+        self.bloom_filter: Optional[CountingBloomFilter[T]] = make_filter(
+            comparator, false_positive_rate, bloom_capacity, bloom_key
+        )
+
+    def __len__(self) -> int:
+        return self.size - self.tombstone_count
+
+    def __contains__(self, input_value: T) -> bool:
+        return self.contains(input_value)
 
     def _bisect(self, arr: List[T], x: T, left: bool = True) -> int:
         return _bisect(arr, x, self.comparator, left)
@@ -169,9 +244,38 @@ class BPTree(Generic[T]):
     def _get_order(node: Optional[Node[T]]) -> int:
         return -1 if node is None else node.order()
 
-    def _delete_order_1(self, ix: int, node: Node[T]):
+    def _unlink(self, node: Node[T]) -> None:
+        previous, next = node.previous, node.next
+
+        if node is self.head:
+            self.head = next
+        if node is self.tail:
+            self.tail = previous
+
+        if previous is not None:
+            previous.next = next
+        if next is not None:
+            next.previous = previous
+
+        node.previous = node.next = None
+
+    def _delete_order_1(self, ix: int, node: Node[T], cascade: bool = True):
         if node.is_root():
-            self.root = node.children[0]
+            if not node.is_leaf():
+                self.root = node.children[0]
+                self.root.parent = None
+            elif self.head is None:
+                self.head = self.tail = node
+        elif node.is_leaf():
+            parent = node.parent
+
+            self._unlink(node)
+            parent.children.pop(ix)
+            if not parent.is_empty():
+                parent.values.pop(ix - 1 if ix > 0 else 0)
+
+            if cascade and parent.order() == 1:
+                self._delete_order_1(self._child_ix(parent), parent)
         else:
             parent = node.parent
 
@@ -180,7 +284,7 @@ class BPTree(Generic[T]):
                 BPTree._get_order(left_node),
                 BPTree._get_order(right_node),
             )
-            has_left = left_order >= 2 and right_order < 2
+            has_left = left_order > 2 or (right_order <= 2 and left_node is not None)
             parent_ix = ix - 1 if has_left else ix
             adj_node = left_node if has_left else right_node
 
@@ -201,7 +305,7 @@ class BPTree(Generic[T]):
                     node=adj_node,
                     adj_node=node,
                     has_left=not has_left,
-                    rotate_children=not node.is_leaf(),
+                    rotate_children=True,
                 )
 
                 parent.values.pop(parent_ix)
@@ -209,61 +313,371 @@ class BPTree(Generic[T]):
 
             if left_order > 2 or right_order > 2:
                 transfer()
-            elif left_order <= 2 or right_order <= 2:
+            else:
                 merge()
-                if parent.order() == 1:
-                    grandparent = parent.parent
+                if cascade and parent.order() == 1:
+                    self._delete_order_1(self._child_ix(parent), parent)
 
-                    if grandparent is not None:
-                        rotate_ix = len(adj_node.values) - 1 if has_left else 0
-                        ix = self._bisect_positive(
-                            grandparent.values, adj_node.values[rotate_ix]
-                        )
-                    self._delete_order_1(ix, parent)
+    @staticmethod
+    def _child_ix(node: Node[T]) -> int:
+        return 0 if node.parent is None else node.parent.children.index(node)
 
-    def delete(self, input_value: T):
+    def _has(self, ix: int, node: Node[T], input_value: T) -> bool:
+        return (
+            ix < len(node.values) and self.comparator(node.values[ix], input_value) == 0
+        )
+
+    @staticmethod
+    def _walk(
+        ix: int, node: Optional[Node[T]], forward: bool
+    ) -> Tuple[int, Optional[Node[T]]]:
+        while node is not None and (ix < 0 or ix >= len(node.values)):
+            node = node.next if forward else node.previous
+            if node is not None:
+                ix = 0 if forward else len(node.values) - 1
+
+        return ix, node
+
+    @staticmethod
+    def _adjacent(
+        ix: int, node: Node[T], forward: bool
+    ) -> Tuple[int, Optional[Node[T]]]:
+        return BPTree._walk(ix + 1 if forward else ix - 1, node, forward)
+
+    def _rewind(self, input_value: T, ix: int, node: Node[T]) -> Tuple[int, Node[T]]:
+        while True:
+            previous_ix, previous = BPTree._adjacent(ix, node, False)
+            if (
+                previous is None
+                or self.comparator(previous.values[previous_ix], input_value) < 0
+            ):
+                return ix, node
+
+            ix, node = previous_ix, previous
+
+    def _find_copy(
+        self, input_value: T, tombstone: bool = False
+    ) -> Optional[Tuple[int, Node[T]]]:
         ix, node = self.find(input_value)
 
-        def get_parent_ix() -> Tuple[Optional[int], Node[T]]:
-            if node.is_leaf():
-                parent_ix = (
-                    None
-                    if node.is_root() or node.order() > 2
-                    else self._bisect_positive(node.parent.values, input_value, False)
-                )
-                return parent_ix, node
-            else:
-                successor = self._successor(ix, node)
-                value = successor.values[0]
-                parent_ix = self._bisect_positive(successor.parent.values, value)
+        if self.tombstone_count == 0:
+            if tombstone:
+                return None
+            elif self._has(ix, node, input_value):
+                return ix, node
 
-                node.values[ix] = value
+        ix, node = BPTree._walk(*self._rewind(input_value, ix, node), True)
 
-                return parent_ix, successor
+        while node is not None:
+            if self.comparator(node.values[ix], input_value) != 0:
+                break
+            elif node.is_tombstone(ix) == tombstone:
+                return ix, node
 
-        previous, next = node.previous, node.next
+            ix, node = BPTree._adjacent(ix, node, True)
 
-        if previous is not None:
-            previous.next = next
+        return None
+
+    def _lookup(self, input_value: T) -> Optional[Tuple[int, Node[T]]]:
+        if self.bloom_filter is not None and input_value not in self.bloom_filter:
+            return None
+
+        position = self._find_copy(input_value)
+
+        if position is None and self.bloom_filter is not None:
+            self.bloom_filter.false_positives += 1
+
+        return position
 
-            if next is not None:
-                next.previous = previous
+    def _rebuild_bloom_filter(self, capacity: Optional[int] = None) -> None:
+        if self.bloom_filter is not None:
+            values: List[T] = []
+            self.for_each(values.append)
 
-        parent_ix, node = get_parent_ix()
-        value = node.values.pop(ix)
+            self.bloom_filter.rebuild(values, capacity)
+
+    def bloom_stats(self) -> Optional[BloomFilterStats]:
+        return None if self.bloom_filter is None else self.bloom_filter.stats()
+
+    def contains(self, input_value: T) -> bool:
+        return self._lookup(input_value) is not None
+
+    def _delete(self, input_value: T):
+        position = self._lookup(input_value)
+
+        if position is None:
+            return None
+
+        ix, node = position
+        value, _ = node.pop_value(ix)
+
+        self.size -= 1
+        self.version += 1
+
+        if self.bloom_filter is not None:
+            self.bloom_filter.remove(value)
 
         if node.order() == 1:
-            self._delete_order_1(parent_ix, node)
-            return value
+            self._delete_order_1(self._child_ix(node), node)
+
+        return value
+
+    def _remove_values(self, values: List[T], tombstones: int) -> None:
+        self.size -= len(values) + tombstones
+        self.tombstone_count -= tombstones
+        self.version += 1
+
+        if self.bloom_filter is not None:
+            for value in values:
+                self.bloom_filter.remove(value)
+
+    def _detach_between(self, left: Node[T], right: Node[T]) -> None:
+        left_path, right_path = [left], [right]
+
+        while left_path[-1].parent is not right_path[-1].parent:
+            left_path.append(left_path[-1].parent)
+            right_path.append(right_path[-1].parent)
+
+        ancestor = left_path[-1].parent
+        left_ix = self._child_ix(left_path[-1])
+        right_ix = self._child_ix(right_path[-1])
+
+        del ancestor.children[left_ix + 1 : right_ix]
+        del ancestor.values[left_ix : right_ix - 1]
+
+        for child, node in zip(left_path, left_path[1:]):
+            ix = self._child_ix(child)
+            del node.children[ix + 1 :]
+            del node.values[ix:]
+
+        for child, node in zip(right_path, right_path[1:]):
+            ix = self._child_ix(child)
+            del node.children[:ix]
+            del node.values[:ix]
+
+        pending = [node for nodes in zip(left_path, right_path) for node in nodes]
+        self._repair(pending + [ancestor])
+
+    def _is_attached(self, node: Node[T]) -> bool:
+        if node.is_root():
+            return node is self.root
+        else:
+            return any(child is node for child in node.parent.children)
+
+    def _repair(self, pending: List[Node[T]]) -> None:
+        while len(pending) > 0:
+            deferred: List[Node[T]] = []
+
+            pending.sort(key=lambda node: node.has_children())
+            for node in pending:
+                if (
+                    node.order() > 1
+                    or not self._is_attached(node)
+                    or any(node is other for other in deferred)
+                ):
+                    continue
+
+                parent = node.parent
+                if parent is not None and len(parent.children) == 1:
+                    deferred.append(node)
+                else:
+                    self._delete_order_1(self._child_ix(node), node, cascade=False)
+                    if parent is not None:
+                        deferred.append(parent)
+
+            pending = deferred
+
+    def delete_range(self, low: T, high: T) -> int:
+        """Delete every key in the half-open interval [low, high).
+
+        Returns the number of live keys removed; tombstoned keys in the interval
+        are dropped too, but not counted.
+        """
+        if self.comparator(low, high) >= 0:
+            return 0
+
+        low_ix, left = self._rewind(low, *self.find(low))
+        high_ix, right = self._rewind(high, *self.find(high))
+        interior = 0
+
+        if left is right:
+            values, tombstones = left.pop_values(low_ix, high_ix)
+            self._remove_values(values, tombstones)
+
+            if left.order() == 1:
+                self._delete_order_1(self._child_ix(left), left)
         else:
-            return value
+            values, tombstones = left.pop_values(low_ix, len(left.values))
+            right_values, right_tombstones = right.pop_values(0, high_ix)
+            values += right_values
+            tombstones += right_tombstones
+
+            # Leaves in between are detached whole, so their values are only
+            # gathered when the bloom filter needs them removed.
+            node = left.next
+            while node is not right:
+                if self.bloom_filter is not None:
+                    node_values, node_tombstones = node.pop_values(0, len(node.values))
+                    values += node_values
+                else:
+                    node_tombstones = (
+                        0 if node.tombstones is None else sum(node.tombstones)
+                    )
+                    interior += len(node.values) - node_tombstones
+
+                tombstones += node_tombstones
+                node = node.next
+
+            self.size -= interior
+            self._remove_values(values, tombstones)
+
+            left.next = right
+            right.previous = left
+
+            self._detach_between(left, right)
+
+        return len(values) + interior
+
+    def min(self) -> Optional[T]:
+        node: Optional[Node[T]] = self.head
+        while node is not None:
+            for ix, value in enumerate(node.values):
+                if not node.is_tombstone(ix):
+                    return value
+            node = node.next
+
+        return None
+
+    def max(self) -> Optional[T]:
+        node: Optional[Node[T]] = self.tail
+        while node is not None:
+            for ix in range(len(node.values) - 1, -1, -1):
+                if not node.is_tombstone(ix):
+                    return node.values[ix]
+            node = node.previous
+
+        return None
+
+    def _pop_leaf_values(self, leaf: Node[T], low: int, high: int) -> List[T]:
+        values, tombstones = leaf.pop_values(low, high)
+        self._remove_values(values, tombstones)
+
+        if leaf.is_empty():
+            self._delete_order_1(self._child_ix(leaf), leaf)
+
+        return values
+
+    def pop_min_many(self, k: int) -> List[T]:
+        values: List[T] = []
+
+        while len(values) < k and len(self) > 0:
+            values.extend(self._pop_leaf_values(self.head, 0, k - len(values)))
+
+        return values
+
+    def pop_min(self) -> Optional[T]:
+        values = self.pop_min_many(1)
+        return values[0] if len(values) > 0 else None
+
+    def pop_max(self) -> Optional[T]:
+        while len(self) > 0:
+            leaf = self.tail
+            values = self._pop_leaf_values(leaf, -1, len(leaf.values))
+
+            if len(values) > 0:
+                return values[0]
+
+        return None
+
+    def _delete_lazy(self, input_value: T):
+        position = self._lookup(input_value)
+
+        if position is None:
+            return None
+
+        ix, node = position
+        value = node.values[ix]
+
+        node.set_tombstone(ix, True)
+        self.tombstone_count += 1
+        self.version += 1
+
+        if self.bloom_filter is not None:
+            self.bloom_filter.remove(value)
+
+        if self.tombstone_count >= self.compact_threshold * self.size:
+            self.compact()
+
+        return value
+
+    def delete(self, input_value: T):
+        if self.lazy_delete:
+            return self._delete_lazy(input_value)
+        else:
+            return self._delete(input_value)
+
+    def _bulk_load(self, values: List[T]) -> Node[T]:
+        leaf_capacity = self.order - 1
+
+        height = 1
+        while leaf_capacity * self.order ** (height - 1) < len(values):
+            height += 1
+
+        leaves: List[Node[T]] = []
+
+        def recurse(low: int, high: int, height: int) -> Node[T]:
+            if height == 1:
+                leaf = Node(tree_order=self.order, values=values[low:high])
+                leaves.append(leaf)
+                return leaf
+
+            child_capacity = leaf_capacity * self.order ** (height - 2)
+            child_count = max(2, -(-(high - low) // child_capacity))
+            child_values = high - low
+
+            children, separators = [], []
+            for n in range(child_count):
+                if n > 0:
+                    separators.append(values[low])
+
+                size = child_values // child_count + (n < child_values % child_count)
+                children.append(recurse(low, low + size, height - 1))
+                low += size
+
+            return Node(tree_order=self.order, children=children, values=separators)
+
+        root = recurse(0, len(values), height)
+
+        for left, right in zip(leaves, leaves[1:]):
+            left.next = right
+            right.previous = left
+
+        self.head, self.tail = leaves[0], leaves[-1]
+
+        return root
+
+    def compact(self) -> None:
+        values: List[T] = []
+        self.for_each(values.append)
+
+        self.root = self._bulk_load(values)
+        self.size = len(values)
+        self.version += 1
+        self.tombstone_count = 0
+
+        if self.bloom_filter is not None:
+            capacity = max(self.bloom_filter.capacity, len(values))
+            self.bloom_filter.rebuild(values, capacity)
 
     def _split_insert(self, node: Node[T]):
         split_value, right_node = node.split()
 
+        if node is self.tail:
+            self.tail = right_node
+
         parent = node.parent
         if parent is not None:
-            ix = self._bisect_positive(parent.values, split_value)
+            ix = self._child_ix(node)
 
             parent.insert_child(ix + 1, right_node)
             parent.values.insert(ix, split_value)
@@ -279,15 +693,73 @@ class BPTree(Generic[T]):
 
     def _insert(self, input_value: T) -> None:
         ix, node = self.find(input_value)
-        node.values.insert(ix, input_value)
+        node.insert_value(ix, input_value)
+        self.version += 1
 
         if node.is_full():
             self._split_insert(node)
 
     def insert(self, *input_values: T) -> None:
         for input_value in input_values:
-            self._insert(input_value)
+            position = (
+                self._find_copy(input_value, tombstone=True)
+                if self.tombstone_count > 0
+                else None
+            )
+
+            if position is not None:
+                ix, node = position
+                node.values[ix] = input_value
+                node.set_tombstone(ix, False)
+                self.tombstone_count -= 1
+                self.version += 1
+            else:
+                self._insert(input_value)
+                self.size += 1
+
+            if self.bloom_filter is not None:
+                self.bloom_filter.add(input_value)
+                if self.bloom_filter.count > self.bloom_filter.capacity:
+                    self._rebuild_bloom_filter(2 * self.bloom_filter.capacity)
+
+    def profile(self, max_height: int = 3) -> TreeProfile:
+        return profile_tree(
+            self.root, self.order, leaf_keys_only=True, max_height=max_height
+        )
 
     def for_each(self, func: Callable[[T], None]) -> None:
-        min_node = self._successor(-1, self.root)
-        min_node.next
+        node: Optional[Node[T]] = self.head
+        while node is not None:
+            for ix, value in enumerate(node.values):
+                if not node.is_tombstone(ix):
+                    func(value)
+            node = node.next
+
+    def cursor(self) -> "Cursor[T]":
+        return Cursor(self)
+
+
+class Cursor(TreeCursor[T]):
+    def _position(self, ix: int, node: Optional[Node[T]], forward: bool) -> None:
+        ix, node = BPTree._walk(ix, node, forward)
+
+        while node is not None and node.is_tombstone(ix):
+            ix, node = BPTree._adjacent(ix, node, forward)
+
+        self.ix, self.node = ix, node
+        self.key: Optional[T] = None if node is None else node.values[ix]
+        self.version = self.tree.version
+
+    def _step(self, forward: bool) -> None:
+        self._position(
+            self.ix + 1 if forward else self.ix - 1, self.node, forward=forward
+        )
+
+    def first(self) -> Optional[T]:
+        self._position(0, self.tree.head, forward=True)
+        return self.key
+
+    def last(self) -> Optional[T]:
+        node = self.tree.tail
+        self._position(len(node.values) - 1, node, forward=False)
+        return self.key
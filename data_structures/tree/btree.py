@@ -1,6 +1,9 @@
 from typing import *
 
 from ..utils import Comparator, bisect_left, default_comparator
+from ..set.bloom_filter import BloomFilterStats, CountingBloomFilter, make_filter
+from .cursor import TreeCursor
+from .profile import TreeProfile, profile_tree
 
 T = TypeVar("T")
 
@@ -25,6 +28,7 @@ class Node(Generic[T]):
             child.parent = self
 
         self.values = values
+        self.tombstones: Optional[List[bool]] = None
         self.parent = parent
 
     def insert_child(self, ix: int, child: "Node[T]") -> None:
@@ -52,7 +56,30 @@ class Node(Generic[T]):
     def has_children(self) -> bool:
         return len(self.children) > 0
 
-    def split(self) -> Tuple[T, "Node[T]"]:
+    def is_tombstone(self, ix: int) -> bool:
+        return self.tombstones is not None and self.tombstones[ix]
+
+    def set_tombstone(self, ix: int, tombstone: bool) -> None:
+        if self.tombstones is None:
+            if not tombstone:
+                return
+            self.tombstones = [False] * len(self.values)
+
+        self.tombstones[ix] = tombstone
+
+    def insert_value(self, ix: int, value: T, tombstone: bool = False) -> None:
+        if self.tombstones is None and tombstone:
+            self.tombstones = [False] * len(self.values)
+
+        self.values.insert(ix, value)
+        if self.tombstones is not None:
+            self.tombstones.insert(ix, tombstone)
+
+    def pop_value(self, ix: int = -1) -> Tuple[T, bool]:
+        tombstone = False if self.tombstones is None else self.tombstones.pop(ix)
+        return self.values.pop(ix), tombstone
+
+    def split(self) -> Tuple[T, bool, "Node[T]"]:
         split_ix = self.tree_order // 2 + 1
 
         right_children = self.children[split_ix:]
@@ -68,7 +95,13 @@ class Node(Generic[T]):
             parent=self.parent,
         )
 
-        return self.values.pop(), right_node
+        if self.tombstones is not None:
+            right_node.tombstones = self.tombstones[split_ix:]
+            self.tombstones = self.tombstones[:split_ix]
+
+        split_value, split_tombstone = self.pop_value()
+
+        return split_value, split_tombstone, right_node
 
     def get_child(self, ix: int) -> Optional["Node[T]"]:
         if self.parent is not None:
@@ -86,10 +119,35 @@ class Node(Generic[T]):
 
 
 class BTree(Generic[T]):
-    def __init__(self, order: int, comparator: Comparator = default_comparator):
+    def __init__(
+        self,
+        order: int,
+        comparator: Comparator = default_comparator,
+        lazy_delete: bool = False,
+        compact_threshold: float = 0.5,
+        false_positive_rate: Optional[float] = None,
+        bloom_capacity: int = 1024,
+        bloom_key: Optional[Callable[[T], Hashable]] = None,
+    ):
         self.order = order
         self.comparator = comparator
         self.root: Node[T] = Node(tree_order=order)
+        self.size = 0
+        self.version = 0
+
+        self.lazy_delete = lazy_delete
+        self.compact_threshold = compact_threshold
+        self.tombstone_count = 0
+
+        self.bloom_filter: Optional[CountingBloomFilter[T]] = make_filter(
+            comparator, false_positive_rate, bloom_capacity, bloom_key
+        )
+
+    def __len__(self) -> int:
+        return self.size - self.tombstone_count
+
+    def __contains__(self, input_value: T) -> bool:
+        return self.contains(input_value)
 
     def _bisect(self, arr: List[T], x: T, negate_found: bool = False) -> int:
         return bisect_left(arr, x, self.comparator, negate_found)
@@ -112,6 +170,99 @@ class BTree(Generic[T]):
     def find(self, input_value: T) -> Tuple[int, Node[T]]:
         return self._find(input_value, self.root)
 
+    def _has(self, ix: int, node: Node[T], input_value: T) -> bool:
+        return (
+            ix < len(node.values) and self.comparator(node.values[ix], input_value) == 0
+        )
+
+    @staticmethod
+    def _ascend(
+        ix: int, node: Optional[Node[T]], forward: bool
+    ) -> Tuple[int, Optional[Node[T]]]:
+        while node is not None and (ix < 0 or ix >= len(node.values)):
+            if node.is_root():
+                node = None
+            else:
+                child_ix = BTree._child_ix(node)
+                node = node.parent
+                ix = child_ix if forward else child_ix - 1
+
+        return ix, node
+
+    @staticmethod
+    def _descend(ix: int, node: Node[T], forward: bool) -> Tuple[int, Node[T]]:
+        if node.is_leaf():
+            return (ix + 1 if forward else ix - 1), node
+        elif forward:
+            return 0, BTree._successor(ix, node)
+        else:
+            node = node.children[ix]
+            while not node.is_leaf():
+                node = node.children[-1]
+            return len(node.values) - 1, node
+
+    @staticmethod
+    def _adjacent(
+        ix: int, node: Node[T], forward: bool
+    ) -> Tuple[int, Optional[Node[T]]]:
+        return BTree._ascend(*BTree._descend(ix, node, forward), forward)
+
+    def _rewind(self, input_value: T, ix: int, node: Node[T]) -> Tuple[int, Node[T]]:
+        while True:
+            previous_ix, previous = BTree._adjacent(ix, node, False)
+            if (
+                previous is None
+                or self.comparator(previous.values[previous_ix], input_value) < 0
+            ):
+                return ix, node
+
+            ix, node = previous_ix, previous
+
+    def _find_copy(
+        self, input_value: T, tombstone: bool = False
+    ) -> Optional[Tuple[int, Node[T]]]:
+        ix, node = self.find(input_value)
+
+        if self.tombstone_count == 0:
+            found = not tombstone and self._has(ix, node, input_value)
+            return (ix, node) if found else None
+
+        ix, node = BTree._ascend(*self._rewind(input_value, ix, node), True)
+
+        while node is not None:
+            if self.comparator(node.values[ix], input_value) != 0:
+                break
+            elif node.is_tombstone(ix) == tombstone:
+                return ix, node
+
+            ix, node = BTree._adjacent(ix, node, True)
+
+        return None
+
+    def _lookup(self, input_value: T) -> Optional[Tuple[int, Node[T]]]:
+        if self.bloom_filter is not None and input_value not in self.bloom_filter:
+            return None
+
+        position = self._find_copy(input_value)
+
+        if position is None and self.bloom_filter is not None:
+            self.bloom_filter.false_positives += 1
+
+        return position
+
+    def _rebuild_bloom_filter(self, capacity: Optional[int] = None) -> None:
+        if self.bloom_filter is not None:
+            values: List[T] = []
+            self.for_each(values.append)
+
+            self.bloom_filter.rebuild(values, capacity)
+
+    def bloom_stats(self) -> Optional[BloomFilterStats]:
+        return None if self.bloom_filter is None else self.bloom_filter.stats()
+
+    def contains(self, input_value: T) -> bool:
+        return self._lookup(input_value) is not None
+
     @staticmethod
     def _successor(ix: int, node: Node[T]) -> Node[T]:
         if node.is_leaf():
@@ -122,6 +273,10 @@ class BTree(Generic[T]):
                 child = child.children[0]
             return child
 
+    @staticmethod
+    def _child_ix(node: Node[T]) -> int:
+        return 0 if node.parent is None else node.parent.children.index(node)
+
     @staticmethod
     def _rotate(
         parent_value_ix: int,
@@ -131,16 +286,18 @@ class BTree(Generic[T]):
         rotate_children: bool = True,
     ) -> None:
         parent = node.parent
-        new_root = adj_node.values.pop() if go_left else adj_node.values.pop(0)
+        new_root, new_root_tombstone = adj_node.pop_value(-1 if go_left else 0)
 
         new_sibling = parent.values[parent_value_ix]
+        new_sibling_tombstone = parent.is_tombstone(parent_value_ix)
+
         parent.values[parent_value_ix] = new_root
+        parent.set_tombstone(parent_value_ix, new_root_tombstone)
 
         if rotate_children:
-            if go_left:
-                node.values.insert(0, new_sibling)
-            else:
-                node.values.append(new_sibling)
+            node.insert_value(
+                0 if go_left else len(node.values), new_sibling, new_sibling_tombstone
+            )
 
             if adj_node.has_children():
                 child = adj_node.children.pop() if go_left else adj_node.children.pop(0)
@@ -181,7 +338,7 @@ class BTree(Generic[T]):
                 )
 
             def merge() -> None:
-                node.values.append(None)
+                node.insert_value(len(node.values), None)
 
                 BTree._rotate(
                     parent_value_ix=parent_value_ix,
@@ -189,7 +346,7 @@ class BTree(Generic[T]):
                     adj_node=node,
                     go_left=not go_left,
                 )
-                parent.values.pop(parent_value_ix)
+                parent.pop_value(parent_value_ix)
                 parent.children.pop(child_ix)
 
             if left_order > 2 or right_order > 2:
@@ -197,87 +354,185 @@ class BTree(Generic[T]):
             elif left_order <= 2 or right_order <= 2:
                 merge()
                 if parent.order() == 1:
-                    grandparent = parent.parent
-                    parent_ix = (
-                        self._bisect(grandparent.values, adj_node.values[0])
-                        if grandparent is not None
-                        else 0
-                    )
-                    self._delete_order_1(parent_ix, parent)
+                    self._delete_order_1(BTree._child_ix(parent), parent)
 
-    def delete(self, input_value: T):
-        value_ix, node = self.find(input_value)
+    def _delete(self, input_value: T):
+        position = self._lookup(input_value)
+
+        if position is None:
+            return None
+
+        value_ix, node = position
+        deleted_value = node.values[value_ix]
 
-        def get_successor_ix() -> Tuple[int, Node[T], T]:
+        self.size -= 1
+        self.version += 1
+
+        if self.bloom_filter is not None:
+            self.bloom_filter.remove(deleted_value)
+
+        def get_successor() -> Node[T]:
             if node.is_leaf():
-                child_ix = (
-                    value_ix
-                    if node.is_root() or node.order() > 2
-                    else self._bisect(node.parent.values, input_value)
-                )
-                return child_ix, node, node.values.pop(value_ix)
+                node.pop_value(value_ix)
+                return node
             else:
                 successor = self._successor(value_ix, node)
-                value = successor.values[0]
 
-                child_ix = self._bisect(successor.parent.values, value)
+                node.values[value_ix] = successor.values[0]
+                node.set_tombstone(value_ix, successor.is_tombstone(0))
+                successor.pop_value(0)
 
-                node.values[value_ix] = value
+                return successor
 
-                return child_ix, successor, successor.values.pop(0)
-
-        child_ix, node, value = get_successor_ix()
+        node = get_successor()
 
         if node.order() == 1 and not node.is_root():
-            self._delete_order_1(child_ix, node)
-            return value
+            self._delete_order_1(BTree._child_ix(node), node)
+
+        return deleted_value
+
+    def _delete_lazy(self, input_value: T):
+        position = self._lookup(input_value)
+
+        if position is None:
+            return None
+
+        ix, node = position
+        value = node.values[ix]
+
+        node.set_tombstone(ix, True)
+        self.tombstone_count += 1
+        self.version += 1
+
+        if self.bloom_filter is not None:
+            self.bloom_filter.remove(value)
+
+        if self.tombstone_count >= self.compact_threshold * self.size:
+            self.compact()
+
+        return value
+
+    def delete(self, input_value: T):
+        if self.lazy_delete:
+            return self._delete_lazy(input_value)
         else:
-            return value
+            return self._delete(input_value)
+
+    def _bulk_load(self, values: List[T]) -> Node[T]:
+        height = 1
+        while self.order ** height - 1 < len(values):
+            height += 1
+
+        def recurse(low: int, high: int, height: int) -> Node[T]:
+            if height == 1:
+                return Node(tree_order=self.order, values=values[low:high])
+
+            child_capacity = self.order ** (height - 1) - 1
+            child_count = max(2, -(-(high - low + 1) // (child_capacity + 1)))
+            child_values = high - low - (child_count - 1)
+
+            children, separators = [], []
+            for n in range(child_count):
+                size = child_values // child_count + (n < child_values % child_count)
+                children.append(recurse(low, low + size, height - 1))
+                low += size
+
+                if n < child_count - 1:
+                    separators.append(values[low])
+                    low += 1
+
+            return Node(tree_order=self.order, children=children, values=separators)
+
+        return recurse(0, len(values), height)
+
+    def compact(self) -> None:
+        values: List[T] = []
+        self.for_each(values.append)
+
+        self.root = self._bulk_load(values)
+        self.size = len(values)
+        self.version += 1
+        self.tombstone_count = 0
+
+        if self.bloom_filter is not None:
+            capacity = max(self.bloom_filter.capacity, len(values))
+            self.bloom_filter.rebuild(values, capacity)
 
     def _split_insert(self, node: Node[T]):
-        split_value, right_node = node.split()
+        split_value, split_tombstone, right_node = node.split()
 
         parent = node.parent
 
         if parent is not None:
-            child_ix = self._bisect(parent.values, split_value)
+            child_ix = BTree._child_ix(node)
 
             parent.insert_child(child_ix + 1, right_node)
-            parent.values.insert(child_ix, split_value)
+            parent.insert_value(child_ix, split_value, split_tombstone)
         else:
             children = [node, right_node]
             values = [split_value]
             self.root = parent = Node(
                 tree_order=self.order, children=children, values=values
             )
+            parent.set_tombstone(0, split_tombstone)
 
         if parent.is_full():
             self._split_insert(parent)
 
     def _insert(self, input_value: T) -> None:
         value_ix, node = self.find(input_value)
-        node.values.insert(value_ix, input_value)
+        if not node.is_leaf():
+            value_ix, node = 0, self._successor(value_ix, node)
+
+        node.insert_value(value_ix, input_value)
+        self.version += 1
 
         if node.is_full():
             self._split_insert(node)
 
     def insert(self, *input_values: T) -> None:
         for input_value in input_values:
-            self._insert(input_value)
+            position = (
+                self._find_copy(input_value, tombstone=True)
+                if self.tombstone_count > 0
+                else None
+            )
+
+            if position is not None:
+                ix, node = position
+                node.values[ix] = input_value
+                node.set_tombstone(ix, False)
+                self.tombstone_count -= 1
+                self.version += 1
+            else:
+                self._insert(input_value)
+                self.size += 1
+
+            if self.bloom_filter is not None:
+                self.bloom_filter.add(input_value)
+                if self.bloom_filter.count > self.bloom_filter.capacity:
+                    self._rebuild_bloom_filter(2 * self.bloom_filter.capacity)
 
     def for_each(self, func: Callable[[T], None]) -> None:
         def recurse(node: Node[T]) -> None:
             if not node.is_leaf():
                 for n, child in enumerate(node.children):
                     recurse(child)
-                    if n < len(node.values):
+                    if n < len(node.values) and not node.is_tombstone(n):
                         func(node.values[n])
             else:
-                for value in node.values:
-                    func(value)
+                for n, value in enumerate(node.values):
+                    if not node.is_tombstone(n):
+                        func(value)
 
         recurse(self.root)
 
+    def profile(self, max_height: int = 3) -> TreeProfile:
+        return profile_tree(self.root, self.order, max_height=max_height)
+
+    def cursor(self) -> "Cursor[T]":
+        return Cursor(self)
+
     def p(self):
         def recurse(node: Node[T], s: str, depth: int = 0):
 
@@ -301,6 +556,33 @@ class BTree(Generic[T]):
         return recurse(self.root, "")
 
 
+class Cursor(TreeCursor[T]):
+    def _position(self, ix: int, node: Optional[Node[T]], forward: bool) -> None:
+        ix, node = BTree._ascend(ix, node, forward)
+
+        while node is not None and node.is_tombstone(ix):
+            ix, node = BTree._adjacent(ix, node, forward)
+
+        self.ix, self.node = ix, node
+        self.key: Optional[T] = None if node is None else node.values[ix]
+        self.version = self.tree.version
+
+    def _step(self, forward: bool) -> None:
+        self._position(*BTree._descend(self.ix, self.node, forward), forward)
+
+    def first(self) -> Optional[T]:
+        self._position(0, self.tree._successor(-1, self.tree.root), forward=True)
+        return self.key
+
+    def last(self) -> Optional[T]:
+        node = self.tree.root
+        while not node.is_leaf():
+            node = node.children[-1]
+
+        self._position(len(node.values) - 1, node, forward=False)
+        return self.key
+
+
 if __name__ == "__main__":
     tree: BTree[int] = BTree(4)
 
@@ -0,0 +1,89 @@
+from abc import ABC, abstractmethod
+from typing import *
+
+T = TypeVar("T")
+
+
+class TreeCursor(ABC, Generic[T]):
+    def __init__(self, tree: Any) -> None:
+        self.tree = tree
+        self.first()
+
+    def is_valid(self) -> bool:
+        return self.version == self.tree.version
+
+    @abstractmethod
+    def _position(self, ix: int, node: Any, forward: bool) -> None:
+        ...
+
+    @abstractmethod
+    def _step(self, forward: bool) -> None:
+        ...
+
+    @abstractmethod
+    def first(self) -> Optional[T]:
+        ...
+
+    @abstractmethod
+    def last(self) -> Optional[T]:
+        ...
+
+    def _finger(self, input_value: T) -> Any:
+        node, comparator = self.node, self.tree.comparator
+
+        if node is None or not self.is_valid():
+            return self.tree.root
+
+        below = comparator(input_value, node.values[0]) < 0
+        if not below and comparator(input_value, node.values[-1]) <= 0:
+            return node
+
+        # The target already lies on the near side of every separator above, so
+        # the first separator past it on the far side bounds a covering subtree.
+        while not node.is_root():
+            parent, ix = node.parent, self.tree._child_ix(node)
+
+            if below:
+                if ix > 0 and comparator(input_value, parent.values[ix - 1]) > 0:
+                    break
+            elif (
+                ix < len(parent.values)
+                and comparator(input_value, parent.values[ix]) < 0
+            ):
+                break
+
+            node = parent
+
+        return node
+
+    def seek(self, input_value: T) -> Optional[T]:
+        ix, node = self.tree._find(input_value, self._finger(input_value))
+        ix, node = self.tree._rewind(input_value, ix, node)
+        self._position(ix, node, forward=True)
+        return self.key
+
+    def next(self) -> Optional[T]:
+        if self.node is None:
+            return None
+
+        if not self.is_valid():
+            key = self.key
+            # Re-seeking lands on key itself or, if it was deleted, its successor.
+            if self.seek(key) is None or self.tree.comparator(self.key, key) != 0:
+                return self.key
+
+        self._step(forward=True)
+        return self.key
+
+    def prev(self) -> Optional[T]:
+        if self.node is None:
+            return None
+
+        if not self.is_valid():
+            key = self.key
+            # Nothing at or after key survived, so its predecessor is the last key.
+            if self.seek(key) is None:
+                return self.last()
+
+        self._step(forward=False)
+        return self.key
@@ -0,0 +1,148 @@
+import math
+import sys
+from typing import *
+
+FILL_BINS = 10
+
+# Average fill of a B-tree node under random insertion is ~ln(2).
+AVERAGE_FILL = math.log(2)
+
+EMPTY_LIST_BYTES = sys.getsizeof([])
+POINTER_BYTES = sys.getsizeof([None]) - EMPTY_LIST_BYTES
+
+
+class TreeProfile(NamedTuple):
+    order: int
+    height: int
+    nodes_per_level: List[int]
+    node_count: int
+    key_count: int
+    tombstone_count: int
+    tombstone_ratio: float
+    separator_count: int
+    fill_histogram: List[int]
+    average_fill: float
+    node_bytes: int
+    overallocated_bytes: int
+    bytes_per_node: float
+    bytes_per_key: float
+    recommended_order: int
+
+    def report(self) -> str:
+        bin_width = 100 // FILL_BINS
+        histogram = "\n".join(
+            f"    {n * bin_width:3d}-{(n + 1) * bin_width:3d}%: {count}"
+            for n, count in enumerate(self.fill_histogram)
+        )
+
+        return (
+            f"order: {self.order}\n"
+            f"height: {self.height}\n"
+            f"nodes per level: {self.nodes_per_level}\n"
+            f"nodes: {self.node_count}\n"
+            f"keys: {self.key_count}\n"
+            f"tombstones: {self.tombstone_count} ({self.tombstone_ratio:.2%})\n"
+            f"separators: {self.separator_count}\n"
+            f"average fill: {self.average_fill:.2%}\n"
+            f"fill histogram:\n{histogram}\n"
+            f"node bytes: {self.node_bytes} "
+            f"({self.overallocated_bytes} overallocated)\n"
+            f"bytes per node: {self.bytes_per_node:.1f}\n"
+            f"bytes per key: {self.bytes_per_key:.1f}\n"
+            f"recommended order: {self.recommended_order}"
+        )
+
+
+def list_bytes(arr: list) -> Tuple[int, int]:
+    size = sys.getsizeof(arr)
+    capacity = (size - EMPTY_LIST_BYTES) // POINTER_BYTES
+
+    return size, (capacity - len(arr)) * POINTER_BYTES
+
+
+def node_bytes(node: Any) -> Tuple[int, int]:
+    size = sys.getsizeof(node)
+    if hasattr(node, "__dict__"):
+        size += sys.getsizeof(node.__dict__)
+
+    values_size, values_over = list_bytes(node.values)
+    children_size, children_over = list_bytes(node.children)
+
+    size += values_size + children_size
+    over = values_over + children_over
+
+    if getattr(node, "tombstones", None) is not None:
+        tombstones_size, tombstones_over = list_bytes(node.tombstones)
+        size += tombstones_size
+        over += tombstones_over
+
+    return size, over
+
+
+def recommended_order(key_count: int, max_height: int = 3) -> int:
+    order = 3
+
+    while True:
+        fanout = (order - 1) * AVERAGE_FILL + 1
+        if fanout ** max_height >= key_count + 1:
+            return order
+        order += 1
+
+
+def profile_tree(
+    root: Any, order: int, leaf_keys_only: bool = False, max_height: int = 3
+) -> TreeProfile:
+    max_keys = order - 1
+
+    nodes_per_level: List[int] = []
+    fill_histogram = [0] * FILL_BINS
+
+    key_count = tombstone_count = separator_count = 0
+    total_bytes = total_over = 0
+    total_fill = 0.0
+
+    level = [root]
+    while len(level) > 0:
+        nodes_per_level.append(len(level))
+        next_level = []
+
+        for node in level:
+            fill = len(node.values) / max_keys
+            total_fill += fill
+            fill_histogram[min(int(fill * FILL_BINS), FILL_BINS - 1)] += 1
+
+            size, over = node_bytes(node)
+            total_bytes += size
+            total_over += over
+
+            if node.is_leaf() or not leaf_keys_only:
+                tombstones = sum(getattr(node, "tombstones", None) or ())
+                key_count += len(node.values) - tombstones
+                tombstone_count += tombstones
+            else:
+                separator_count += len(node.values)
+
+            next_level.extend(node.children)
+
+        level = next_level
+
+    node_count = sum(nodes_per_level)
+    slot_count = key_count + tombstone_count
+
+    return TreeProfile(
+        order=order,
+        height=len(nodes_per_level),
+        nodes_per_level=nodes_per_level,
+        node_count=node_count,
+        key_count=key_count,
+        tombstone_count=tombstone_count,
+        tombstone_ratio=tombstone_count / slot_count if slot_count > 0 else 0.0,
+        separator_count=separator_count,
+        fill_histogram=fill_histogram,
+        average_fill=total_fill / node_count,
+        node_bytes=total_bytes,
+        overallocated_bytes=total_over,
+        bytes_per_node=total_bytes / node_count,
+        bytes_per_key=total_bytes / key_count if key_count > 0 else 0.0,
+        recommended_order=recommended_order(key_count, max_height),
+    )
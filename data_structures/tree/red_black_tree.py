@@ -0,0 +1,167 @@
+from typing import *
+
+from .binary_tree import BinaryTree, Node
+
+T = TypeVar("T")
+
+
+class RedBlackNode(Node[T]):
+    __slots__ = ("red",)
+
+    def __init__(self, value: T, parent: Optional[Node[T]] = None) -> None:
+        super().__init__(value, parent)
+        self.red = True
+
+
+def is_red(node: Optional[RedBlackNode[T]]) -> bool:
+    return node is not None and node.red
+
+
+class RedBlackTree(BinaryTree[T]):
+    def _create_node(self, input_value: T, parent: Optional[Node[T]]) -> Node[T]:
+        return RedBlackNode(input_value, parent)
+
+    def _insert_fixup(self, node: RedBlackNode[T]) -> None:
+        while is_red(node.parent):
+            parent = node.parent
+            grandparent = parent.parent
+
+            if parent is grandparent.left:
+                uncle = grandparent.right
+
+                if is_red(uncle):
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                    continue
+
+                if node is parent.right:
+                    node, parent = parent, node
+                    self._rotate_left(node)
+
+                parent.red, grandparent.red = False, True
+                self._rotate_right(grandparent)
+            else:
+                uncle = grandparent.left
+
+                if is_red(uncle):
+                    parent.red = uncle.red = False
+                    grandparent.red = True
+                    node = grandparent
+                    continue
+
+                if node is parent.left:
+                    node, parent = parent, node
+                    self._rotate_right(node)
+
+                parent.red, grandparent.red = False, True
+                self._rotate_left(grandparent)
+
+        self.root.red = False
+
+    def _delete_fixup(
+        self,
+        node: RedBlackNode[T],
+        child: Optional[RedBlackNode[T]],
+        parent: Optional[RedBlackNode[T]],
+        is_left: bool,
+    ) -> None:
+        if node.red:
+            return
+
+        while child is not self.root and not is_red(child):
+            if is_left:
+                sibling = parent.right
+
+                if sibling.red:
+                    sibling.red, parent.red = False, True
+                    self._rotate_left(parent)
+                    sibling = parent.right
+
+                if not is_red(sibling.left) and not is_red(sibling.right):
+                    sibling.red = True
+                    child, parent = parent, parent.parent
+                    is_left = parent is not None and parent.left is child
+                    continue
+
+                if not is_red(sibling.right):
+                    sibling.left.red, sibling.red = False, True
+                    self._rotate_right(sibling)
+                    sibling = parent.right
+
+                sibling.red, parent.red = parent.red, False
+                sibling.right.red = False
+                self._rotate_left(parent)
+            else:
+                sibling = parent.left
+
+                if sibling.red:
+                    sibling.red, parent.red = False, True
+                    self._rotate_right(parent)
+                    sibling = parent.left
+
+                if not is_red(sibling.left) and not is_red(sibling.right):
+                    sibling.red = True
+                    child, parent = parent, parent.parent
+                    is_left = parent is not None and parent.left is child
+                    continue
+
+                if not is_red(sibling.left):
+                    sibling.right.red, sibling.red = False, True
+                    self._rotate_left(sibling)
+                    sibling = parent.left
+
+                sibling.red, parent.red = parent.red, False
+                sibling.left.red = False
+                self._rotate_right(parent)
+
+            child = self.root
+            break
+
+        if child is not None:
+            child.red = False
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from .avl_tree import AVLTree
+    from .btree import BTree
+
+    n = 100_000
+
+    keys = list(range(n))
+    random.shuffle(keys)
+
+    trees: Dict[str, Any] = {"red-black": RedBlackTree(), "avl": AVLTree()}
+    for order in (4, 16, 64, 256):
+        trees[f"btree({order})"] = BTree(order)
+
+    def percentiles(timings: List[int]) -> str:
+        timings.sort()
+        return "".join(
+            f"{timings[min(int(len(timings) * p), len(timings) - 1)] / 1000:>9.1f}"
+            for p in (0.5, 0.99, 0.999, 1.0)
+        )
+
+    header = "".join(f"{p:>9}" for p in ("p50", "p99", "p99.9", "max"))
+    print(f"{'(us)':<22}{header}")
+
+    for name, tree in trees.items():
+        insert_timings, delete_timings = [], []
+
+        for key in keys:
+            start = time.perf_counter_ns()
+            tree.insert(key)
+            insert_timings.append(time.perf_counter_ns() - start)
+
+        random.shuffle(keys)
+
+        for key in keys:
+            start = time.perf_counter_ns()
+            tree.delete(key)
+            delete_timings.append(time.perf_counter_ns() - start)
+
+        print(f"{name + ' insert':<22}{percentiles(insert_timings)}")
+        print(f"{name + ' delete':<22}{percentiles(delete_timings)}")
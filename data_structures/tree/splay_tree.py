@@ -0,0 +1,202 @@
+from typing import *
+
+from ..utils import Comparator, default_comparator
+
+T = TypeVar("T")
+
+
+class Node(Generic[T]):
+    __slots__ = ("value", "left", "right")
+
+    def __init__(
+        self,
+        value: T,
+        left: Optional["Node[T]"] = None,
+        right: Optional["Node[T]"] = None,
+    ) -> None:
+        self.value = value
+        self.left = left
+        self.right = right
+
+    def __repr__(self) -> str:
+        return f"{self.value}"
+
+    def is_leaf(self) -> bool:
+        return self.left is None and self.right is None
+
+
+class SplayTree(Generic[T]):
+    def __init__(self, comparator: Comparator = default_comparator):
+        self.comparator = comparator
+        self.root: Optional[Node[T]] = None
+        self.size = 0
+
+        self._header: Node[T] = Node(None)
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __contains__(self, input_value: T) -> bool:
+        return self.contains(input_value)
+
+    def _splay(self, input_value: T, node: Node[T]) -> Node[T]:
+        comparator = self.comparator
+
+        header = self._header
+        left = right = header
+
+        while True:
+            comp = comparator(input_value, node.value)
+
+            if comp < 0:
+                child = node.left
+                if child is None:
+                    break
+
+                if comparator(input_value, child.value) < 0:
+                    node.left = child.right
+                    child.right = node
+                    node = child
+                    if node.left is None:
+                        break
+
+                right.left = node
+                right = node
+                node = node.left
+            elif comp > 0:
+                child = node.right
+                if child is None:
+                    break
+
+                if comparator(input_value, child.value) > 0:
+                    node.right = child.left
+                    child.left = node
+                    node = child
+                    if node.right is None:
+                        break
+
+                left.right = node
+                left = node
+                node = node.right
+            else:
+                break
+
+        left.right = node.left
+        right.left = node.right
+        node.left = header.right
+        node.right = header.left
+
+        header.left = header.right = None
+
+        return node
+
+    def find(self, input_value: T) -> Optional[Node[T]]:
+        if self.root is None:
+            return None
+
+        self.root = self._splay(input_value, self.root)
+
+        return self.root if self.comparator(input_value, self.root.value) == 0 else None
+
+    def contains(self, input_value: T) -> bool:
+        return self.find(input_value) is not None
+
+    def _insert(self, input_value: T) -> None:
+        if self.root is None:
+            self.root = Node(input_value)
+            self.size += 1
+            return
+
+        root = self._splay(input_value, self.root)
+        comp = self.comparator(input_value, root.value)
+
+        if comp <= 0:
+            node = Node(input_value, root.left, root)
+            root.left = None
+        else:
+            node = Node(input_value, root, root.right)
+            root.right = None
+
+        self.root = node
+        self.size += 1
+
+    def insert(self, *input_values: T) -> None:
+        for input_value in input_values:
+            self._insert(input_value)
+
+    def delete(self, input_value: T):
+        if self.root is None:
+            return None
+
+        root = self._splay(input_value, self.root)
+
+        if self.comparator(input_value, root.value) != 0:
+            self.root = root
+            return None
+
+        if root.left is None:
+            self.root = root.right
+        else:
+            # Every value on the left is no larger, so splaying for input_value
+            # brings up its maximum or a copy of input_value; only further
+            # copies can sit to the right of the latter.
+            node = self.root = self._splay(input_value, root.left)
+            while node.right is not None:
+                node = node.right
+            node.right = root.right
+
+        self.size -= 1
+
+        return root.value
+
+    def for_each(self, func: Callable[[T], None]) -> None:
+        stack: List[Node[T]] = []
+        node = self.root
+
+        while len(stack) > 0 or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+            node = stack.pop()
+            func(node.value)
+            node = node.right
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    from .btree import BTree
+
+    n = 100_000
+    lookups = 200_000
+
+    keys = list(range(n))
+    random.shuffle(keys)
+
+    weights = [1 / (rank + 1) for rank in range(n)]
+    workloads = {
+        "uniform": random.choices(keys, k=lookups),
+        "zipf": random.choices(keys, weights=weights, k=lookups),
+    }
+
+    trees: Dict[str, Any] = {"splay": SplayTree()}
+    for order in (4, 16, 64, 256):
+        trees[f"btree({order})"] = BTree(order)
+
+    for tree in trees.values():
+        tree.insert(*keys)
+
+    print(f"{'':<12}" + "".join(f"{workload:>12}" for workload in workloads))
+
+    for name, tree in trees.items():
+        timings = []
+
+        for workload in workloads.values():
+            start = time.perf_counter()
+            for key in workload:
+                tree.contains(key)
+            timings.append(time.perf_counter() - start)
+
+        print(f"{name:<12}" + "".join(f"{timing:>11.3f}s" for timing in timings))
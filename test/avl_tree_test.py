@@ -0,0 +1,96 @@
+import unittest
+from typing import *
+import random
+
+from data_structures.tree.avl_tree import AVLTree, AVLNode, height
+
+
+random.seed(1)
+
+
+class AVLTreeTest(unittest.TestCase):
+    def assertBalanced(self, tree: AVLTree):
+        stack: List[Optional[AVLNode]] = [tree.root]
+
+        while len(stack) > 0:
+            node = stack.pop()
+
+            if node is None:
+                continue
+
+            left, right = height(node.left), height(node.right)
+
+            self.assertLessEqual(abs(left - right), 1)
+            self.assertEqual(node.height, 1 + max(left, right))
+
+            for child in (node.left, node.right):
+                if child is not None:
+                    self.assertIs(child.parent, node)
+                stack.append(child)
+
+    def test_insert_sorted(self):
+        tree = AVLTree()
+        tree.insert(*range(1023))
+
+        self.assertBalanced(tree)
+        self.assertEqual(tree.root.height, 10)
+        self.assertEqual(list(tree), list(range(1023)))
+
+    def test_insert_delete_many(self):
+        n = 1000
+        nums = list(range(n))
+        random.shuffle(nums)
+
+        tree = AVLTree()
+        tree.insert(*nums)
+
+        random.shuffle(nums)
+        remaining = set(nums)
+
+        for num in nums:
+            self.assertEqual(tree.delete(num), num)
+            remaining.discard(num)
+
+            self.assertBalanced(tree)
+            self.assertEqual(len(tree), len(remaining))
+
+            if len(remaining) % 100 == 0:
+                self.assertEqual(list(tree), sorted(remaining))
+
+        self.assertIsNone(tree.root)
+        self.assertEqual(len(tree), 0)
+
+    def test_duplicates(self):
+        nums = [i % 50 for i in range(500)]
+        random.shuffle(nums)
+
+        tree = AVLTree()
+        tree.insert(*nums)
+
+        self.assertBalanced(tree)
+        self.assertEqual(list(tree), sorted(nums))
+
+        random.shuffle(nums)
+        remaining = sorted(nums)
+
+        for num in nums:
+            self.assertEqual(tree.delete(num), num)
+            remaining.remove(num)
+
+            self.assertBalanced(tree)
+            self.assertEqual(len(tree), len(remaining))
+
+            if len(remaining) % 100 == 0:
+                self.assertEqual(list(tree), remaining)
+
+        self.assertIsNone(tree.root)
+
+    def test_range(self):
+        tree = AVLTree()
+        tree.insert(*range(100))
+
+        self.assertEqual(list(tree.range(90, 95)), [90, 91, 92, 93, 94])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+from typing import *
+import random
+
+from data_structures.tree.binary_tree import BinaryTree, Node
+
+
+random.seed(1)
+
+
+class BinaryTreeTest(unittest.TestCase):
+    def test_insert(self):
+        tree = BinaryTree()
+
+        nums = list(range(1000))
+        random.shuffle(nums)
+        tree.insert(*nums)
+
+        self.assertEqual(list(tree), list(range(1000)))
+        self.assertEqual(len(tree), 1000)
+
+    def test_insert_duplicates(self):
+        tree = BinaryTree()
+        tree.insert(5, 3, 5, 8, 5)
+
+        self.assertEqual(list(tree), [3, 5, 5, 5, 8])
+        self.assertEqual(len(tree), 5)
+        self.assertEqual(list(tree.range(5, 6)), [5, 5, 5])
+
+        self.assertEqual(tree.delete(5), 5)
+        self.assertEqual(list(tree), [3, 5, 5, 8])
+
+    def test_delete(self):
+        tree = BinaryTree()
+
+        nums = list(range(1000))
+        random.shuffle(nums)
+        tree.insert(*nums)
+
+        random.shuffle(nums)
+        remaining = set(nums)
+
+        for num in nums[:500]:
+            self.assertEqual(tree.delete(num), num)
+            self.assertIsNone(tree.delete(num))
+            remaining.discard(num)
+
+        self.assertEqual(list(tree), sorted(remaining))
+
+    def test_range(self):
+        tree = BinaryTree()
+        tree.insert(*range(0, 100, 2))
+
+        self.assertEqual(list(tree.range(10, 20)), [10, 12, 14, 16, 18])
+        self.assertEqual(list(tree.range(11, 15)), [12, 14])
+        self.assertEqual(list(tree.range(-10, 3)), [0, 2])
+        self.assertEqual(list(tree.range(98, 200)), [98])
+        self.assertEqual(list(tree.range(50, 50)), [])
+
+    def test_iterator_is_lazy(self):
+        tree = BinaryTree()
+        tree.insert(*range(10))
+
+        values = iter(tree)
+
+        self.assertEqual(next(values), 0)
+        self.assertEqual(next(values), 1)
+
+    def test_min_max(self):
+        tree = BinaryTree()
+
+        self.assertIsNone(tree.min())
+
+        tree.insert(5, 3, 8, 1)
+
+        self.assertEqual(tree.min(), 1)
+        self.assertEqual(tree.max(), 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+import unittest
+from typing import *
+import random
+
+from data_structures.set.bloom_filter import CountingBloomFilter, make_filter
+from data_structures.utils import default_comparator
+
+
+random.seed(1)
+
+
+class CountingBloomFilterTest(unittest.TestCase):
+    def test_no_false_negatives(self):
+        bloom_filter = CountingBloomFilter(capacity=1000, false_positive_rate=0.01)
+        values = random.sample(range(10 ** 6), 1000)
+
+        for value in values:
+            bloom_filter.add(value)
+
+        for value in values:
+            self.assertIn(value, bloom_filter)
+
+    def test_false_positive_rate(self):
+        bloom_filter = CountingBloomFilter(capacity=1000, false_positive_rate=0.01)
+
+        for value in range(1000):
+            bloom_filter.add(value)
+
+        false_positives = sum(value in bloom_filter for value in range(1000, 21000))
+
+        self.assertLess(false_positives / 20000, 0.03)
+        self.assertLess(bloom_filter.estimated_false_positive_rate(), 0.02)
+
+    def test_remove(self):
+        bloom_filter = CountingBloomFilter(capacity=100)
+
+        for value in range(100):
+            bloom_filter.add(value)
+        for value in range(50):
+            bloom_filter.remove(value)
+
+        self.assertEqual(bloom_filter.count, 50)
+        for value in range(50, 100):
+            self.assertIn(value, bloom_filter)
+
+    def test_rebuild(self):
+        bloom_filter = CountingBloomFilter(capacity=10)
+        bloom_filter.rebuild(range(100), capacity=100)
+
+        stats = bloom_filter.stats()
+
+        self.assertEqual(stats.capacity, 100)
+        self.assertEqual(stats.count, 100)
+        for value in range(100):
+            self.assertIn(value, bloom_filter)
+
+    def test_key(self):
+        bloom_filter = CountingBloomFilter(capacity=100, key=str.lower)
+
+        for value in ("Apple", "Banana", "Cherry"):
+            bloom_filter.add(value)
+
+        for value in ("apple", "BANANA", "cHeRrY"):
+            self.assertIn(value, bloom_filter)
+
+        bloom_filter.remove("APPLE")
+        self.assertEqual(bloom_filter.count, 2)
+
+    def test_unhashable(self):
+        with self.assertRaises(TypeError):
+            CountingBloomFilter(capacity=100).add([1, 2])
+
+        bloom_filter = CountingBloomFilter(capacity=100, key=tuple)
+        bloom_filter.add([1, 2])
+
+        self.assertIn([1, 2], bloom_filter)
+
+    def test_make_filter(self):
+        comparator = lambda x, y: default_comparator(x.lower(), y.lower())
+
+        self.assertIsNone(make_filter(default_comparator, None, 100))
+        self.assertIsNone(make_filter(comparator, None, 100))
+
+        with self.assertRaises(ValueError):
+            make_filter(comparator, 0.01, 100)
+
+        bloom_filter = make_filter(comparator, 0.01, 100, str.lower)
+        bloom_filter.add("Apple")
+
+        self.assertIn("APPLE", bloom_filter)
+        self.assertEqual(bloom_filter.capacity, 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,10 +3,371 @@ from typing import *
 import random
 
 from data_structures.tree.bptree import BPTree, Node
+from data_structures.utils import default_comparator
 
 
 TEST_ORDER = 3
 
+random.seed(1)
+
+
+class BPTreeTest(unittest.TestCase):
+    def leaf_values(self, tree: BPTree) -> List:
+        node = tree.root
+        while not node.is_leaf():
+            node = node.children[0]
+
+        values = []
+        while node is not None:
+            values.extend(node.values)
+            node = node.next
+
+        return values
+
+    def test_insert_leaf_chain(self):
+        n = 1000
+        nums = list(range(n))
+        random.shuffle(nums)
+
+        for order in range(TEST_ORDER, 12):
+            tree = BPTree(order=order)
+            tree.insert(*nums)
+
+            self.assertEqual(self.leaf_values(tree), list(range(n)))
+
+    def test_insert_delete_many(self):
+        n = 1000
+        nums = list(range(n))
+        random.shuffle(nums)
+
+        for order in range(TEST_ORDER, 12):
+            tree = BPTree(order=order)
+            tree.insert(*nums)
+
+            random.shuffle(nums)
+            remaining = set(nums)
+
+            for num in nums:
+                self.assertEqual(tree.delete(num), num)
+                remaining.discard(num)
+
+                self.assertEqual(self.leaf_values(tree), sorted(remaining))
+
+    def test_lazy_delete(self):
+        n = 1000
+        nums = list(range(n))
+        random.shuffle(nums)
+
+        tree = BPTree(order=4, lazy_delete=True, compact_threshold=0.25)
+        tree.insert(*nums)
+
+        k = n // 4 - 1
+
+        for num in nums[:k]:
+            tree.delete(num)
+            self.assertNotIn(num, tree)
+
+        self.assertEqual(len(tree), n - k)
+
+        tree.delete(nums[k])
+
+        values = []
+        tree.for_each(values.append)
+
+        self.assertEqual(tree.tombstone_count, 0)
+        self.assertEqual(values, sorted(nums[k + 1 :]))
+        self.assertEqual(self.leaf_values(tree), values)
+
+    def test_lazy_delete_duplicates(self):
+        tree = BPTree(order=4, lazy_delete=True, compact_threshold=1)
+        tree.insert(5, 5, 6)
+        tree.delete(5)
+
+        values = []
+        tree.for_each(values.append)
+
+        self.assertEqual(values, [5, 6])
+        self.assertEqual(len(tree), 2)
+        self.assertIn(5, tree)
+
+        tree.delete(5)
+
+        self.assertNotIn(5, tree)
+        self.assertIsNone(tree.delete(5))
+        self.assertEqual(len(tree), 1)
+
+    def test_lazy_delete_comparator(self):
+        comparator = lambda x, y: default_comparator(x.lower(), y.lower())
+
+        tree = BPTree(
+            order=4, comparator=comparator, lazy_delete=True, compact_threshold=1
+        )
+        tree.insert("Apple", "banana", "Cherry")
+
+        self.assertEqual(tree.delete("apple"), "Apple")
+        self.assertNotIn("APPLE", tree)
+        self.assertEqual(len(tree), 2)
+
+        tree.insert("aPPle")
+
+        self.assertIn("apple", tree)
+        self.assertEqual(len(tree), 3)
+        self.assertEqual(tree.size, 3)
+
+    def test_lazy_delete_unhashable(self):
+        tree = BPTree(order=4, lazy_delete=True, compact_threshold=1)
+        tree.insert(*([n] for n in range(20)))
+
+        for n in range(0, 20, 2):
+            self.assertEqual(tree.delete([n]), [n])
+
+        values = []
+        tree.for_each(values.append)
+
+        self.assertEqual(values, [[n] for n in range(1, 20, 2)])
+
+    def test_delete_range(self):
+        n = 1000
+
+        for order in range(TEST_ORDER, 12):
+            for low, high in [(0, n), (10, 20), (-5, 300), (250, 750), (990, n + 5)]:
+                tree = BPTree(order=order)
+                tree.insert(*range(n))
+
+                expected = [i for i in range(n) if not low <= i < high]
+
+                self.assertEqual(tree.delete_range(low, high), n - len(expected))
+                self.assertEqual(self.leaf_values(tree), expected)
+                self.assertEqual(len(tree), len(expected))
+
+                tree.insert(*range(low, high))
+                self.assertEqual(
+                    self.leaf_values(tree), list(range(min(low, 0), max(high, n)))
+                )
+
+    def test_delete_range_lazy(self):
+        for false_positive_rate in (None, 0.01):
+            tree = BPTree(
+                order=TEST_ORDER,
+                lazy_delete=True,
+                compact_threshold=1,
+                false_positive_rate=false_positive_rate,
+            )
+            tree.insert(*range(20))
+
+            for num in range(0, 10, 2):
+                tree.delete(num)
+
+            self.assertEqual(tree.delete_range(0, 10), 5)
+            self.assertEqual(len(tree), 10)
+            self.assertEqual(tree.size, 10)
+            self.assertEqual(tree.tombstone_count, 0)
+            self.assertEqual(self.leaf_values(tree), list(range(10, 20)))
+            self.assertFalse(any(num in tree for num in range(10)))
+
+    def test_delete_range_empty(self):
+        tree = BPTree(order=TEST_ORDER)
+        tree.insert(*range(10))
+
+        self.assertEqual(tree.delete_range(5, 5), 0)
+        self.assertEqual(tree.delete_range(20, 30), 0)
+        self.assertEqual(self.leaf_values(tree), list(range(10)))
+
+    def test_cursor(self):
+        for order in range(TEST_ORDER, 8):
+            tree = BPTree(order=order)
+            tree.insert(*range(0, 200, 2))
+
+            cursor = tree.cursor()
+
+            values = [cursor.key]
+            while cursor.next() is not None:
+                values.append(cursor.key)
+
+            self.assertEqual(values, list(range(0, 200, 2)))
+
+            values = [cursor.last()]
+            while cursor.prev() is not None:
+                values.append(cursor.key)
+
+            self.assertEqual(values, list(range(198, -1, -2)))
+
+            self.assertEqual(cursor.seek(51), 52)
+            self.assertEqual(cursor.seek(3), 4)
+            self.assertEqual(cursor.seek(120), 120)
+            self.assertIsNone(cursor.seek(199))
+
+    def test_cursor_revalidate(self):
+        tree = BPTree(order=TEST_ORDER)
+        tree.insert(*range(100))
+
+        cursor = tree.cursor()
+        cursor.seek(50)
+
+        tree.delete_range(50, 60)
+        self.assertFalse(cursor.is_valid())
+        self.assertEqual(cursor.next(), 60)
+
+        tree.delete(60)
+        self.assertEqual(cursor.prev(), 49)
+
+    def test_cursor_revalidate_lazy(self):
+        tree = BPTree(order=TEST_ORDER, lazy_delete=True, compact_threshold=1)
+        tree.insert(*range(100))
+
+        cursor = tree.cursor()
+        cursor.seek(50)
+
+        tree.delete(50)
+        self.assertFalse(cursor.is_valid())
+        self.assertEqual(cursor.next(), 51)
+
+        tree.insert(50)
+        self.assertFalse(cursor.is_valid())
+        self.assertEqual(cursor.prev(), 50)
+
+    def test_cursor_finger(self):
+        tree = BPTree(order=8)
+        tree.insert(*range(1000))
+
+        cursor = tree.cursor()
+        parent = cursor.node.parent
+        target = parent.children[-1].values[-1]
+
+        self.assertIs(cursor._finger(target), parent)
+        self.assertEqual(cursor.seek(target), target)
+
+    def test_cursor_revalidate_last(self):
+        tree = BPTree(order=TEST_ORDER)
+        tree.insert(*range(10))
+
+        cursor = tree.cursor()
+        cursor.last()
+
+        tree.delete(9)
+        self.assertFalse(cursor.is_valid())
+        self.assertEqual(cursor.prev(), 8)
+
+        tree.delete(8)
+        self.assertIsNone(cursor.next())
+
+    def test_bloom_filter(self):
+        tree = BPTree(order=4, false_positive_rate=0.01, bloom_capacity=16)
+        tree.insert(*range(0, 1000, 2))
+
+        tree.delete_range(100, 200)
+        tree.delete(500)
+
+        expected = set(range(0, 1000, 2)) - set(range(100, 200)) - {500}
+
+        for num in range(1000):
+            self.assertEqual(num in tree, num in expected)
+
+        stats = tree.bloom_stats()
+
+        self.assertEqual(stats.count, 449)
+        self.assertGreater(stats.negatives, 0)
+
+    def test_bloom_filter_false_positives(self):
+        tree = BPTree(order=4, false_positive_rate=0.1, bloom_capacity=1000)
+        tree.insert(*range(0, 2000, 2))
+
+        for num in range(1, 2000, 2):
+            self.assertIsNone(tree.delete(num))
+
+        tree.lazy_delete = True
+        for num in range(1, 2000, 2):
+            self.assertIsNone(tree.delete(num))
+            self.assertNotIn(num, tree)
+
+        stats = tree.bloom_stats()
+
+        self.assertGreater(stats.false_positives, 0)
+        self.assertEqual(stats.false_positives + stats.negatives, stats.lookups)
+
+    def test_bloom_filter_comparator(self):
+        comparator = lambda x, y: default_comparator(x.lower(), y.lower())
+
+        with self.assertRaises(ValueError):
+            BPTree(order=4, comparator=comparator, false_positive_rate=0.01)
+
+        tree = BPTree(
+            order=4,
+            comparator=comparator,
+            false_positive_rate=0.01,
+            bloom_key=str.lower,
+        )
+        tree.insert("Apple", "banana")
+
+        self.assertIn("apple", tree)
+        self.assertIn("BANANA", tree)
+        self.assertEqual(tree.delete("APPLE"), "Apple")
+        self.assertNotIn("apple", tree)
+
+    def test_min_max(self):
+        tree = BPTree(order=TEST_ORDER)
+
+        self.assertIsNone(tree.min())
+        self.assertIsNone(tree.pop_max())
+
+        nums = list(range(100))
+        random.shuffle(nums)
+        tree.insert(*nums)
+
+        self.assertEqual(tree.min(), 0)
+        self.assertEqual(tree.max(), 99)
+
+        self.assertEqual(tree.pop_min(), 0)
+        self.assertEqual(tree.pop_max(), 99)
+        self.assertEqual(tree.pop_min_many(10), list(range(1, 11)))
+
+        self.assertEqual(tree.min(), 11)
+        self.assertEqual(tree.max(), 98)
+        self.assertEqual(self.leaf_values(tree), list(range(11, 99)))
+
+    def test_pop_until_empty(self):
+        for order in range(TEST_ORDER, 8):
+            tree = BPTree(order=order, lazy_delete=True, compact_threshold=1)
+            tree.insert(*range(200))
+            tree.delete(0)
+            tree.delete(199)
+
+            values = []
+            while len(tree) > 0:
+                values.append(tree.pop_max())
+                values.extend(tree.pop_min_many(3))
+
+            self.assertEqual(sorted(values), list(range(1, 199)))
+            self.assertIs(tree.head, tree.root)
+            self.assertIs(tree.tail, tree.root)
+
+    def test_profile(self):
+        tree = BPTree(order=4)
+        tree.insert(*range(100))
+
+        profile = tree.profile()
+
+        self.assertEqual(profile.key_count, 100)
+        self.assertEqual(profile.nodes_per_level[-1] - 1, profile.separator_count)
+        self.assertEqual(len(profile.nodes_per_level), profile.height)
+        self.assertEqual(sum(profile.fill_histogram), profile.node_count)
+        self.assertEqual(profile.tombstone_count, 0)
+
+    def test_profile_tombstones(self):
+        tree = BPTree(order=4, lazy_delete=True, compact_threshold=1)
+        tree.insert(*range(100))
+
+        for num in range(0, 100, 2):
+            tree.delete(num)
+
+        profile = tree.profile()
+
+        self.assertEqual(profile.key_count, 50)
+        self.assertEqual(profile.tombstone_count, 50)
+        self.assertEqual(profile.tombstone_ratio, 0.5)
+        self.assertIn("tombstones: 50 (50.00%)", profile.report())
+
+
 if __name__ == "__main__":
     tree: BPTree[int] = BPTree(TEST_ORDER)
 
@@ -2,7 +2,8 @@ import unittest
 from typing import *
 import random
 
-from data_structures import BTree, Node, Comparator, T, default_comparator
+from data_structures.tree.btree import BTree, Node, T
+from data_structures.utils import Comparator, default_comparator
 
 
 TEST_ORDER = 4
@@ -138,6 +139,242 @@ class BTreeTest(unittest.TestCase):
                 self.assertTreeSorted(tree)
                 tree.delete(num)
 
+    def test_lazy_delete(self):
+        n = 1000
+        nums = list(range(n))
+        random.shuffle(nums)
+
+        tree = BTree(order=TEST_ORDER, lazy_delete=True, compact_threshold=0.25)
+        tree.insert(*nums)
+
+        k = n // 4 - 1
+
+        for num in nums[:k]:
+            tree.delete(num)
+            self.assertNotIn(num, tree)
+
+        self.assertEqual(tree.tombstone_count, k)
+        self.assertEqual(len(tree), n - k)
+        self.assertTreeSorted(tree)
+
+        tree.delete(nums[k])
+
+        self.assertEqual(tree.tombstone_count, 0)
+        self.assertEqual(tree.size, n - k - 1)
+        self.assertTreeSorted(tree)
+
+    def test_lazy_delete_reinsert(self):
+        tree = BTree(order=TEST_ORDER, lazy_delete=True)
+        tree.insert(*range(10))
+
+        tree.delete(3)
+        tree.insert(3)
+
+        self.assertIn(3, tree)
+        self.assertEqual(tree.size, 10)
+
+    def test_lazy_delete_duplicates(self):
+        tree = BTree(order=TEST_ORDER, lazy_delete=True, compact_threshold=1)
+        tree.insert(5, 5, 6)
+        tree.delete(5)
+
+        values = []
+        tree.for_each(values.append)
+
+        self.assertEqual(values, [5, 6])
+        self.assertEqual(len(tree), 2)
+        self.assertIn(5, tree)
+
+        tree.delete(5)
+
+        self.assertNotIn(5, tree)
+        self.assertIsNone(tree.delete(5))
+        self.assertEqual(len(tree), 1)
+
+    def test_lazy_delete_comparator(self):
+        comparator = lambda x, y: default_comparator(x.lower(), y.lower())
+
+        tree = BTree(
+            order=TEST_ORDER,
+            comparator=comparator,
+            lazy_delete=True,
+            compact_threshold=1,
+        )
+        tree.insert("Apple", "banana", "Cherry")
+
+        self.assertEqual(tree.delete("apple"), "Apple")
+        self.assertNotIn("APPLE", tree)
+        self.assertEqual(len(tree), 2)
+
+        tree.insert("aPPle")
+
+        self.assertIn("apple", tree)
+        self.assertEqual(len(tree), 3)
+        self.assertEqual(tree.size, 3)
+
+    def test_lazy_delete_unhashable(self):
+        tree = BTree(order=TEST_ORDER, lazy_delete=True, compact_threshold=1)
+        tree.insert(*([n] for n in range(20)))
+
+        for n in range(0, 20, 2):
+            self.assertEqual(tree.delete([n]), [n])
+
+        values = []
+        tree.for_each(values.append)
+
+        self.assertEqual(values, [[n] for n in range(1, 20, 2)])
+
+    def test_compact(self):
+        for order in range(TEST_ORDER, 12):
+            tree = BTree(order=order, lazy_delete=True, compact_threshold=1)
+            tree.insert(*range(1000))
+
+            for num in range(0, 1000, 2):
+                tree.delete(num)
+
+            profile = tree.profile()
+            self.assertEqual(profile.key_count, 500)
+            self.assertEqual(profile.tombstone_count, 500)
+
+            tree.compact()
+
+            values = []
+            tree.for_each(values.append)
+
+            self.assertEqual(values, list(range(1, 1000, 2)))
+            self.assertEqual(tree.tombstone_count, 0)
+            self.assertEqual(tree.profile().key_count, 500)
+
+    def test_cursor(self):
+        tree = BTree(order=TEST_ORDER)
+        tree.insert(*range(0, 200, 2))
+
+        cursor = tree.cursor()
+
+        values = [cursor.key]
+        while cursor.next() is not None:
+            values.append(cursor.key)
+
+        self.assertEqual(values, list(range(0, 200, 2)))
+
+        self.assertEqual(cursor.seek(51), 52)
+        self.assertEqual(cursor.seek(40), 40)
+        self.assertEqual(cursor.prev(), 38)
+        self.assertEqual(cursor.seek(150), 150)
+        self.assertEqual(cursor.next(), 152)
+        self.assertIsNone(cursor.seek(500))
+
+        self.assertEqual(cursor.last(), 198)
+        self.assertEqual(cursor.first(), 0)
+
+    def test_cursor_revalidate(self):
+        tree = BTree(order=TEST_ORDER, lazy_delete=True, compact_threshold=1)
+        tree.insert(*range(100))
+
+        cursor = tree.cursor()
+        cursor.seek(50)
+
+        tree.delete(50)
+        self.assertFalse(cursor.is_valid())
+        self.assertEqual(cursor.next(), 51)
+
+        tree.delete(52)
+        self.assertFalse(cursor.is_valid())
+        self.assertEqual(cursor.next(), 53)
+
+        tree.insert(50)
+        self.assertFalse(cursor.is_valid())
+        self.assertEqual(cursor.prev(), 51)
+        self.assertEqual(cursor.prev(), 50)
+
+        tree.lazy_delete = False
+        tree.delete(51)
+        self.assertFalse(cursor.is_valid())
+        self.assertEqual(cursor.next(), 53)
+
+    def test_cursor_revalidate_last(self):
+        tree = BTree(order=TEST_ORDER)
+        tree.insert(*range(10))
+
+        cursor = tree.cursor()
+        cursor.last()
+
+        tree.delete(9)
+        self.assertFalse(cursor.is_valid())
+        self.assertEqual(cursor.prev(), 8)
+
+        tree.delete(8)
+        self.assertIsNone(cursor.next())
+
+    def test_bloom_filter(self):
+        tree = BTree(order=TEST_ORDER, false_positive_rate=0.01, bloom_capacity=16)
+        tree.insert(*range(0, 1000, 2))
+
+        for num in range(0, 1000, 2):
+            self.assertIn(num, tree)
+        for num in range(1, 1000, 2):
+            self.assertNotIn(num, tree)
+            self.assertIsNone(tree.delete(num))
+
+        tree.delete(10)
+        self.assertNotIn(10, tree)
+
+        stats = tree.bloom_stats()
+
+        self.assertEqual(stats.count, 499)
+        self.assertGreaterEqual(stats.capacity, 499)
+        self.assertGreater(stats.negatives, 0)
+        self.assertTreeSorted(tree)
+
+    def test_bloom_filter_false_positives(self):
+        tree = BTree(order=TEST_ORDER, false_positive_rate=0.1, bloom_capacity=1000)
+        tree.insert(*range(0, 2000, 2))
+
+        for num in range(1, 2000, 2):
+            self.assertIsNone(tree.delete(num))
+
+        tree.lazy_delete = True
+        for num in range(1, 2000, 2):
+            self.assertIsNone(tree.delete(num))
+            self.assertNotIn(num, tree)
+
+        stats = tree.bloom_stats()
+
+        self.assertGreater(stats.false_positives, 0)
+        self.assertEqual(stats.false_positives + stats.negatives, stats.lookups)
+
+    def test_bloom_filter_comparator(self):
+        comparator = lambda x, y: default_comparator(x.lower(), y.lower())
+
+        with self.assertRaises(ValueError):
+            BTree(order=TEST_ORDER, comparator=comparator, false_positive_rate=0.01)
+
+        tree = BTree(
+            order=TEST_ORDER,
+            comparator=comparator,
+            false_positive_rate=0.01,
+            bloom_key=str.lower,
+        )
+        tree.insert("Apple", "banana")
+
+        self.assertIn("apple", tree)
+        self.assertIn("BANANA", tree)
+        self.assertEqual(tree.delete("APPLE"), "Apple")
+        self.assertNotIn("apple", tree)
+
+    def test_profile(self):
+        tree = BTree(order=TEST_ORDER)
+        tree.insert(*range(1, 14))
+
+        profile = tree.profile()
+
+        self.assertEqual(profile.height, 3)
+        self.assertEqual(profile.key_count, 13)
+        self.assertEqual(sum(profile.nodes_per_level), profile.node_count)
+        self.assertEqual(sum(profile.fill_histogram), profile.node_count)
+        self.assertGreater(profile.bytes_per_key, 0)
+        self.assertGreaterEqual(profile.recommended_order, 3)
+
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,102 @@
+import unittest
+from typing import *
+import random
+
+from data_structures.tree.red_black_tree import RedBlackTree, RedBlackNode, is_red
+
+
+random.seed(1)
+
+
+class RedBlackTreeTest(unittest.TestCase):
+    def assertRedBlack(self, tree: RedBlackTree):
+        self.assertFalse(is_red(tree.root))
+
+        stack: List[Tuple[Optional[RedBlackNode], int]] = [(tree.root, 0)]
+        black_heights = set()
+
+        while len(stack) > 0:
+            node, black_height = stack.pop()
+
+            if node is None:
+                black_heights.add(black_height)
+                continue
+
+            if node.red:
+                self.assertFalse(is_red(node.left) or is_red(node.right))
+            else:
+                black_height += 1
+
+            for child in (node.left, node.right):
+                if child is not None:
+                    self.assertIs(child.parent, node)
+                stack.append((child, black_height))
+
+        self.assertEqual(len(black_heights), 1)
+
+    def test_insert_sorted(self):
+        tree = RedBlackTree()
+        tree.insert(*range(1000))
+
+        self.assertRedBlack(tree)
+        self.assertEqual(list(tree), list(range(1000)))
+
+    def test_insert_delete_many(self):
+        n = 1000
+        nums = list(range(n))
+        random.shuffle(nums)
+
+        tree = RedBlackTree()
+        tree.insert(*nums)
+
+        random.shuffle(nums)
+        remaining = set(nums)
+
+        for num in nums:
+            self.assertEqual(tree.delete(num), num)
+            remaining.discard(num)
+
+            self.assertRedBlack(tree)
+            self.assertNotIn(num, tree)
+            self.assertEqual(len(tree), len(remaining))
+
+            if len(remaining) % 100 == 0:
+                self.assertEqual(list(tree), sorted(remaining))
+
+        self.assertIsNone(tree.root)
+
+    def test_duplicates(self):
+        nums = [i % 50 for i in range(500)]
+        random.shuffle(nums)
+
+        tree = RedBlackTree()
+        tree.insert(*nums)
+
+        self.assertRedBlack(tree)
+        self.assertEqual(list(tree), sorted(nums))
+
+        random.shuffle(nums)
+        remaining = sorted(nums)
+
+        for num in nums:
+            self.assertEqual(tree.delete(num), num)
+            remaining.remove(num)
+
+            self.assertRedBlack(tree)
+            self.assertEqual(len(tree), len(remaining))
+
+            if len(remaining) % 100 == 0:
+                self.assertEqual(list(tree), remaining)
+
+        self.assertIsNone(tree.root)
+
+    def test_comparator(self):
+        tree = RedBlackTree(comparator=lambda x, y: -1 if x > y else 1 if x < y else 0)
+        tree.insert(*range(100))
+
+        self.assertEqual(list(tree), list(range(99, -1, -1)))
+        self.assertEqual(list(tree.range(50, 45)), [50, 49, 48, 47, 46])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import unittest
+from typing import *
+import random
+
+from data_structures.tree.splay_tree import SplayTree
+
+
+random.seed(1)
+
+
+class SplayTreeTest(unittest.TestCase):
+    def values(self, tree: SplayTree) -> List:
+        values = []
+        tree.for_each(values.append)
+        return values
+
+    def test_insert(self):
+        tree = SplayTree()
+
+        nums = list(range(1000))
+        random.shuffle(nums)
+        tree.insert(*nums)
+
+        self.assertEqual(self.values(tree), list(range(1000)))
+        self.assertEqual(len(tree), 1000)
+
+    def test_insert_duplicate(self):
+        tree = SplayTree()
+        tree.insert(1, 2, 2, 3, 1)
+
+        self.assertEqual(self.values(tree), [1, 1, 2, 2, 3])
+        self.assertEqual(len(tree), 5)
+
+        self.assertEqual(tree.delete(2), 2)
+        self.assertEqual(self.values(tree), [1, 1, 2, 3])
+        self.assertIn(2, tree)
+
+    def test_delete_duplicates(self):
+        nums = [i % 50 for i in range(500)]
+        random.shuffle(nums)
+
+        tree = SplayTree()
+        tree.insert(*nums)
+
+        random.shuffle(nums)
+        remaining = sorted(nums)
+
+        for num in nums:
+            self.assertEqual(tree.delete(num), num)
+            remaining.remove(num)
+
+            self.assertEqual(num in tree, num in remaining)
+            self.assertEqual(len(tree), len(remaining))
+
+            if len(remaining) % 100 == 0:
+                self.assertEqual(self.values(tree), remaining)
+
+        self.assertIsNone(tree.root)
+
+    def test_find_splays_to_root(self):
+        tree = SplayTree()
+        tree.insert(*range(100))
+
+        node = tree.find(42)
+
+        self.assertIs(node, tree.root)
+        self.assertEqual(node.value, 42)
+        self.assertIsNone(tree.find(100))
+        self.assertEqual(self.values(tree), list(range(100)))
+
+    def test_delete(self):
+        tree = SplayTree()
+
+        nums = list(range(1000))
+        random.shuffle(nums)
+        tree.insert(*nums)
+
+        remaining = set(nums)
+        random.shuffle(nums)
+
+        for num in nums:
+            self.assertEqual(tree.delete(num), num)
+            self.assertIsNone(tree.delete(num))
+            remaining.discard(num)
+
+            self.assertNotIn(num, tree)
+            self.assertEqual(len(tree), len(remaining))
+
+            if len(remaining) % 100 == 0:
+                self.assertEqual(self.values(tree), sorted(remaining))
+
+        self.assertIsNone(tree.root)
+        self.assertEqual(len(tree), 0)
+
+    def test_comparator(self):
+        tree = SplayTree(comparator=lambda x, y: -1 if x > y else 1 if x < y else 0)
+        tree.insert(*range(10))
+
+        self.assertEqual(self.values(tree), list(range(9, -1, -1)))
+
+    def test_sorted_insert_depth(self):
+        tree = SplayTree()
+        tree.insert(*range(10000))
+
+        self.assertIn(0, tree)
+        self.assertEqual(len(self.values(tree)), 10000)
+
+
+if __name__ == "__main__":
+    unittest.main()